@@ -6,6 +6,9 @@ that cap at 10MB and start over (no rotation) for consistent use across all modu
 
 import logging
 import os
+import platform
+import queue
+import threading
 from datetime import datetime
 
 import pytz
@@ -22,6 +25,12 @@ try:
 except ImportError:
     FASTMCP_AVAILABLE = False
 
+try:
+    import liburing  # type: ignore[import-not-found]
+    LIBURING_AVAILABLE = platform.system() == "Linux"
+except ImportError:
+    LIBURING_AVAILABLE = False
+
 from .settings import LOG_FILE_PATH, LOG_LEVEL_STR
 
 # Global Rich console for consistent formatting
@@ -84,6 +93,121 @@ class OverwriteFileHandler(logging.FileHandler):
         super().emit(record)
 
 
+class AsyncUringFileHandler(logging.Handler):
+    """File handler that queues records and writes them via io_uring batches.
+
+    Formatting and enqueueing happen on the emitting thread; a daemon thread
+    drains the queue and submits batched writes through an io_uring ring, so
+    log I/O to slow media (e.g. the Unraid flash drive) never blocks the
+    asyncio event loop. Keeps the same 10MB overwrite-instead-of-rotate cap
+    as OverwriteFileHandler.
+    """
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        max_bytes: int = 10*1024*1024,
+        max_batch: int = 32,
+        queue_depth: int = 64,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            filename: Path to the log file
+            max_bytes: Maximum file size in bytes before overwriting (default: 10MB)
+            max_batch: Maximum records coalesced into one io_uring submission
+            queue_depth: Submission queue depth for the io_uring ring
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.max_bytes = max_bytes
+        self.max_batch = max_batch
+        # None is the shutdown sentinel; everything else is an encoded record
+        self._queue: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._ring = liburing.io_uring()
+        liburing.io_uring_queue_init(queue_depth, self._ring, 0)
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="uring-log-writer", daemon=True
+        )
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format the record and hand it to the writer thread without blocking."""
+        try:
+            self._queue.put((self.format(record) + "\n").encode("utf-8"))
+        except Exception:
+            self.handleError(record)
+
+    def _writer_loop(self) -> None:
+        """Drain the queue, coalescing up to max_batch records per submission."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._write_batch(b"".join(batch))
+                    return
+                batch.append(item)
+            self._write_batch(b"".join(batch))
+
+    def _write_batch(self, data: bytes) -> None:
+        """Submit one batched write through the ring, enforcing the size cap."""
+        try:
+            if os.fstat(self._fd).st_size >= self.max_bytes:
+                os.ftruncate(self._fd, 0)
+            buffer = bytearray(data)
+            iov = liburing.iovec(buffer)
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            liburing.io_uring_prep_writev(sqe, self._fd, iov, 1, -1)
+            liburing.io_uring_submit(self._ring)
+            cqe = liburing.io_uring_cqe()
+            liburing.io_uring_wait_cqe(self._ring, cqe)
+            liburing.io_uring_cqe_seen(self._ring, cqe)
+        except (OSError, ValueError):
+            # Ring trouble shouldn't lose log lines; fall back to a plain write
+            try:
+                os.write(self._fd, data)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Flush outstanding records and tear down the ring and file descriptor."""
+        try:
+            self._queue.put(None)
+            self._writer.join(timeout=2.0)
+            liburing.io_uring_queue_exit(self._ring)
+            os.close(self._fd)
+        except (OSError, ValueError):
+            pass
+        finally:
+            super().close()
+
+
+def _create_file_handler() -> logging.Handler:
+    """Create the shared log file handler.
+
+    Prefers the io_uring-backed handler on Linux when liburing is installed;
+    falls back to the synchronous OverwriteFileHandler everywhere else.
+    """
+    if LIBURING_AVAILABLE:
+        try:
+            return AsyncUringFileHandler(LOG_FILE_PATH, max_bytes=10*1024*1024)
+        except (OSError, ValueError):
+            pass
+    return OverwriteFileHandler(
+        LOG_FILE_PATH,
+        max_bytes=10*1024*1024,
+        encoding='utf-8'
+    )
+
+
 def setup_logger(name: str = "UnraidMCPServer") -> logging.Logger:
     """Set up and configure the logger with console and file handlers.
 
@@ -117,11 +241,7 @@ def setup_logger(name: str = "UnraidMCPServer") -> logging.Logger:
     logger.addHandler(console_handler)
 
     # File Handler with 10MB cap (overwrites instead of rotating)
-    file_handler = OverwriteFileHandler(
-        LOG_FILE_PATH,
-        max_bytes=10*1024*1024,
-        encoding='utf-8'
-    )
+    file_handler = _create_file_handler()
     file_handler.setLevel(numeric_log_level)
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(lineno)d - %(message)s'
@@ -161,11 +281,7 @@ def configure_fastmcp_logger_with_rich() -> logging.Logger | None:
     fastmcp_logger.addHandler(console_handler)
 
     # File Handler with 10MB cap (overwrites instead of rotating)
-    file_handler = OverwriteFileHandler(
-        LOG_FILE_PATH,
-        max_bytes=10*1024*1024,
-        encoding='utf-8'
-    )
+    file_handler = _create_file_handler()
     file_handler.setLevel(numeric_log_level)
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(funcName)s - %(lineno)d - %(message)s'
@@ -194,11 +310,7 @@ def configure_fastmcp_logger_with_rich() -> logging.Logger | None:
     root_logger.addHandler(root_console_handler)
 
     # File Handler for root logger with 10MB cap (overwrites instead of rotating)
-    root_file_handler = OverwriteFileHandler(
-        LOG_FILE_PATH,
-        max_bytes=10*1024*1024,
-        encoding='utf-8'
-    )
+    root_file_handler = _create_file_handler()
     root_file_handler.setLevel(numeric_log_level)
     root_file_handler.setFormatter(file_formatter)
     root_logger.addHandler(root_file_handler)
@@ -0,0 +1,141 @@
+"""Same-tick coalescing of top-level GraphQL query fields.
+
+When an LLM client calls several read-only tools back-to-back, each tool would
+normally fire its own HTTP POST through :func:`make_graphql_request` — one
+connection/parse/validate/execute cycle per call. This module merges the
+top-level fields requested by callers that arrive within the same event-loop
+tick into a single combined query, so concurrent tool calls share one
+round-trip to the Unraid API.
+
+Tool modules register the selection set for each top-level field they own via
+:func:`register_field`; callers then use ``await fetch({"info"})`` and read
+their field out of the combined response.
+"""
+
+import asyncio
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any
+
+from ..config.logging import logger
+from .client import make_graphql_request
+
+# Top-level field name -> selection-set fragment (e.g. "info { ... }"),
+# registered by the tool modules that own the selections so this module
+# stays free of tool imports
+_FIELD_SELECTIONS: dict[str, str] = {}
+
+# Coalescing window for the current event-loop tick: the merged field set and
+# the future that joining callers await. Both are None when no window is open.
+_pending_fields: set[str] | None = None
+_pending_future: asyncio.Future[dict[str, Any]] | None = None
+
+
+def register_field(name: str, selection: str) -> None:
+    """Register the selection set fetched for a top-level query field.
+
+    Args:
+        name: Top-level field name (e.g. 'info', 'array', 'vars')
+        selection: GraphQL selection-set fragment starting with that field
+    """
+    _FIELD_SELECTIONS[name] = selection
+    _combined_query.cache_clear()
+
+
+def _compact(document: str) -> str:
+    """Strip GraphQL comments and collapse whitespace to a single-line form.
+
+    The registered selections carry annotation comments and pretty-printed
+    indentation for readability; neither needs to travel over the wire or be
+    parsed by the Unraid API on cache-miss calls.
+
+    Args:
+        document: Pretty-printed query document
+
+    Returns:
+        Compact single-line equivalent of the document
+    """
+    document = re.sub(r"#[^\n]*", "", document)
+    return re.sub(r"\s+", " ", document).strip()
+
+
+@lru_cache(maxsize=32)
+def _combined_query(fields: frozenset[str]) -> tuple[str, str]:
+    """Build the compact combined query document, cached per unique field set.
+
+    Materialized lazily on first use, so field sets no session ever requests
+    cost nothing beyond their selection constants. The SHA-256 digest of the
+    compact form is computed alongside so warm calls can go over the wire as
+    an Automatic Persisted Query hash instead of the full document.
+
+    Args:
+        fields: Top-level field names to include
+
+    Returns:
+        Tuple of (compact query document, SHA-256 hex digest of the document)
+    """
+    selections = "\n".join(_FIELD_SELECTIONS[name] for name in sorted(fields))
+    document = _compact(f"query Combined {{\n{selections}\n}}")
+    return document, hashlib.sha256(document.encode()).hexdigest()
+
+
+async def fetch(fields: set[str]) -> dict[str, Any]:
+    """Fetch top-level fields, coalescing with other calls in the same tick.
+
+    The first caller in a tick opens a window, yields control once so any
+    concurrently scheduled callers can merge their fields in, then issues one
+    combined request and shares the response with every joiner.
+
+    Args:
+        fields: Registered top-level field names to fetch
+
+    Returns:
+        The combined response data; callers read their own field out of it
+        (it may contain additional fields merged in by concurrent callers).
+    """
+    global _pending_fields, _pending_future
+
+    unknown = fields - _FIELD_SELECTIONS.keys()
+    if unknown:
+        raise KeyError(f"Unregistered batcher field(s): {', '.join(sorted(unknown))}")
+
+    if _pending_future is not None and _pending_fields is not None:
+        # A window is open in this tick; merge our fields and await its result
+        _pending_fields |= fields
+        return await _pending_future
+
+    # Open a new window and give concurrently scheduled callers one tick to join
+    _pending_fields = set(fields)
+    future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+    _pending_future = future
+    try:
+        await asyncio.sleep(0)
+
+        merged = _pending_fields
+        _pending_fields = None
+        _pending_future = None
+
+        if len(merged) > len(fields):
+            logger.debug("Coalesced %d top-level fields into one request", len(merged))
+
+        document, query_hash = _combined_query(frozenset(merged))
+        try:
+            result: dict[str, Any] = await make_graphql_request(document, persisted_hash=query_hash)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case no joiner is awaiting
+            future.exception()
+            raise
+        future.set_result(result)
+        return result
+    finally:
+        # Cancellation safety: if the opener unwound early (e.g. the client
+        # disconnected during the join tick or the request), close the window
+        # so later calls don't join a dead one, and cancel the shared future
+        # so any same-tick joiners wake instead of waiting forever.
+        if _pending_future is future:
+            _pending_fields = None
+            _pending_future = None
+        if not future.done():
+            future.cancel()
@@ -0,0 +1,88 @@
+"""In-process async TTL caching for GraphQL-backed tools.
+
+This module provides a small single-flight TTL cache decorator so that
+identical tool calls arriving within a short window (e.g. from polling
+monitoring clients) share one upstream GraphQL request instead of each
+paying a network round-trip.
+"""
+
+import asyncio
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from ..config.logging import logger
+
+T = TypeVar("T")
+
+# Cache name -> {call key -> (expires_at, in-flight or completed task)}
+_caches: dict[str, dict[tuple[Any, ...], tuple[float, "asyncio.Task[Any]"]]] = {}
+
+
+def async_ttl_cache(
+    ttl_seconds: float,
+    name: str | None = None
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorate an async function with a short-lived single-flight TTL cache.
+
+    Results are cached per argument tuple for ttl_seconds. Concurrent callers
+    that arrive while a request is still in flight await the same task
+    (single-flight), so N concurrent polls collapse into one upstream request.
+    Failed calls are evicted immediately and never served from cache.
+
+    Args:
+        ttl_seconds: How long a successful result stays fresh
+        name: Cache name used with invalidate_cache(); defaults to the
+              decorated function's qualified name
+
+    Returns:
+        Decorator wrapping the async function with caching
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        cache_name = name or f"{func.__module__}.{func.__qualname__}"
+        cache = _caches.setdefault(cache_name, {})
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            entry = cache.get(key)
+            if entry is not None:
+                expires_at, task = entry
+                failed = task.cancelled() or (task.done() and task.exception() is not None)
+                if expires_at > now and not failed:
+                    logger.debug(f"Cache hit for '{cache_name}'")
+                    result: T = await asyncio.shield(task)
+                    return result
+                cache.pop(key, None)
+
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            cache[key] = (now + ttl_seconds, task)
+            try:
+                fresh: T = await asyncio.shield(task)
+                return fresh
+            except Exception:
+                # Don't cache failures; the next caller retries upstream
+                cache.pop(key, None)
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_cache(name: str) -> None:
+    """Clear all cached entries for the named cache.
+
+    Used by mutations to drop stale reads (e.g. the rclone remote list after
+    a remote is created or deleted).
+
+    Args:
+        name: Cache name passed to async_ttl_cache()
+    """
+    entries = _caches.get(name)
+    if entries:
+        entries.clear()
+        logger.debug(f"Invalidated cache '{name}'")
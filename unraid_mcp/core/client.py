@@ -4,19 +4,137 @@ This module provides the HTTP client interface for making GraphQL requests
 to the Unraid API with proper timeout handling and error management.
 """
 
-import json
+import asyncio
+import atexit
+import time
 from typing import Any
 
 import httpx
+import orjson
 
 from ..config.logging import logger
 from ..config.settings import TIMEOUT_CONFIG, UNRAID_API_KEY, UNRAID_API_URL, UNRAID_VERIFY_SSL
-from ..core.exceptions import ToolError
+from ..core.exceptions import CircuitOpenError, ToolError
 
 # HTTP timeout configuration
 DEFAULT_TIMEOUT = httpx.Timeout(10.0, read=30.0, connect=5.0)
 DISK_TIMEOUT = httpx.Timeout(10.0, read=TIMEOUT_CONFIG['disk_operations'], connect=5.0)
 
+# Shared HTTP client so every GraphQL call reuses pooled keep-alive
+# connections instead of paying a TCP/TLS handshake per request
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use.
+
+    The client keeps connections alive across calls and negotiates HTTP/2
+    when available, so concurrent requests multiplex over one TLS connection.
+
+    Returns:
+        The shared httpx.AsyncClient instance
+    """
+    global _shared_client
+
+    if _shared_client is None or _shared_client.is_closed:
+        # Agent tool calls often arrive minutes apart; a long keepalive_expiry
+        # (httpx defaults to 5s) keeps the warm connection across turns so
+        # follow-up calls skip the TCP+TLS handshake entirely
+        limits = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0)
+        try:
+            _shared_client = httpx.AsyncClient(
+                http2=True, verify=UNRAID_VERIFY_SSL, limits=limits, timeout=DEFAULT_TIMEOUT
+            )
+        except ImportError:
+            # The 'h2' package is not installed; fall back to HTTP/1.1 keep-alive
+            logger.debug("HTTP/2 support unavailable, using HTTP/1.1 keep-alive connections")
+            _shared_client = httpx.AsyncClient(
+                verify=UNRAID_VERIFY_SSL, limits=limits, timeout=DEFAULT_TIMEOUT
+            )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _shared_client
+
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
+
+def _close_shared_client_at_exit() -> None:
+    """Best-effort close of pooled connections at interpreter shutdown."""
+    if _shared_client is not None and not _shared_client.is_closed:
+        try:
+            asyncio.run(close_shared_client())
+        except RuntimeError:
+            pass  # An event loop is still running; the OS reclaims the sockets
+
+
+atexit.register(_close_shared_client_at_exit)
+
+# Circuit breaker state: after consecutive network/HTTP failures the client
+# fails fast for an exponentially growing cooldown instead of hammering a
+# dead backend. GraphQL-level errors don't trip it; the server is alive.
+_consecutive_failures = 0
+_circuit_open_until = 0.0
+_CIRCUIT_MAX_COOLDOWN = 30.0
+
+
+def _check_circuit() -> None:
+    """Fail fast with CircuitOpenError while the breaker cooldown is active."""
+    remaining = _circuit_open_until - time.monotonic()
+    if remaining > 0:
+        raise CircuitOpenError(
+            f"Unraid API circuit breaker open for another {remaining:.1f}s "
+            f"after {_consecutive_failures} consecutive failures"
+        )
+
+
+def _record_request_success() -> None:
+    """Reset the circuit breaker after a successful request."""
+    global _consecutive_failures, _circuit_open_until
+    _consecutive_failures = 0
+    _circuit_open_until = 0.0
+
+
+def _record_request_failure() -> None:
+    """Bump the failure count and extend the breaker cooldown."""
+    global _consecutive_failures, _circuit_open_until
+    _consecutive_failures += 1
+    cooldown = min(_CIRCUIT_MAX_COOLDOWN, 2.0 ** _consecutive_failures)
+    _circuit_open_until = time.monotonic() + cooldown
+    logger.warning(
+        f"Unraid API failure #{_consecutive_failures}; failing fast for the next {cooldown:.1f}s"
+    )
+
+
+# Whether the server accepts Apollo Automatic Persisted Queries; flipped to
+# False on the first PersistedQueryNotSupported response so later requests
+# skip the hash-only attempt.
+_apq_supported = True
+
+
+def _check_persisted_query_errors(response_data: dict[str, Any]) -> str | None:
+    """Check a GraphQL response for Automatic Persisted Query protocol errors.
+
+    Args:
+        response_data: Parsed GraphQL response body
+
+    Returns:
+        'not_found' if the server has not seen this query hash yet,
+        'not_supported' if the server does not implement APQ, else None
+    """
+    for err in response_data.get("errors") or []:
+        message = err.get("message", "")
+        code = err.get("extensions", {}).get("code", "")
+        if message == "PersistedQueryNotFound" or code == "PERSISTED_QUERY_NOT_FOUND":
+            return "not_found"
+        if message == "PersistedQueryNotSupported" or code == "PERSISTED_QUERY_NOT_SUPPORTED":
+            return "not_supported"
+    return None
+
 
 def is_idempotent_error(error_message: str, operation: str) -> bool:
     """Check if a GraphQL error represents an idempotent operation that should be treated as success.
@@ -52,7 +170,9 @@ async def make_graphql_request(
     query: str,
     variables: dict[str, Any] | None = None,
     custom_timeout: httpx.Timeout | None = None,
-    operation_context: dict[str, str] | None = None
+    operation_context: dict[str, str] | None = None,
+    persisted_hash: str | None = None,
+    raw_body: bytes | None = None
 ) -> dict[str, Any]:
     """Make GraphQL requests to the Unraid API.
 
@@ -62,6 +182,14 @@ async def make_graphql_request(
         custom_timeout: Optional custom timeout configuration
         operation_context: Optional context for operation-specific error handling
                           Should contain 'operation' key (e.g., 'start', 'stop')
+        persisted_hash: Optional SHA-256 hex digest of the query for Apollo
+                        Automatic Persisted Queries. When set, only the hash is
+                        sent first and the full query is retried on a cache miss.
+        raw_body: Optional pre-encoded JSON body for the first attempt, letting
+                  parameter-free queries skip per-call payload assembly and
+                  encoding. With persisted_hash it should be the hash-only APQ
+                  body (a cache miss still retries with the full query);
+                  without it, the complete request body.
 
     Returns:
         Dict containing the GraphQL response data
@@ -69,22 +197,22 @@ async def make_graphql_request(
     Raises:
         ToolError: For HTTP errors, network errors, or non-idempotent GraphQL errors
     """
+    global _apq_supported
+
     if not UNRAID_API_URL:
         raise ToolError("UNRAID_API_URL not configured")
 
     if not UNRAID_API_KEY:
         raise ToolError("UNRAID_API_KEY not configured")
 
+    _check_circuit()
+
     headers = {
         "Content-Type": "application/json",
         "X-API-Key": UNRAID_API_KEY,
         "User-Agent": "UnraidMCPServer/0.1.0"  # Custom user-agent
     }
 
-    payload: dict[str, Any] = {"query": query}
-    if variables:
-        payload["variables"] = variables
-
     logger.debug(f"Making GraphQL request to {UNRAID_API_URL}:")
     logger.debug(f"Query: {query[:200]}{'...' if len(query) > 200 else ''}")  # Log truncated query
     if variables:
@@ -93,42 +221,206 @@ async def make_graphql_request(
     current_timeout = custom_timeout if custom_timeout is not None else DEFAULT_TIMEOUT
 
     try:
-        async with httpx.AsyncClient(timeout=current_timeout, verify=UNRAID_VERIFY_SSL) as client:
-            response = await client.post(UNRAID_API_URL, json=payload, headers=headers)
+        client = get_shared_client()
+        response_data: dict[str, Any] | None = None
+        extensions = None
+        if persisted_hash and _apq_supported:
+            extensions = {"persistedQuery": {"version": 1, "sha256Hash": persisted_hash}}
+
+        try:
+            if raw_body is not None and (persisted_hash is None or _apq_supported):
+                # Pre-encoded body from the caller; skips payload assembly + encode
+                response = await client.post(
+                    UNRAID_API_URL, content=raw_body, headers=headers, timeout=current_timeout
+                )
+                response.raise_for_status()
+                response_data = orjson.loads(response.content)
+            elif extensions is not None:
+                # Optimistic hash-only request; ~80 bytes instead of the full document
+                payload: dict[str, Any] = {"extensions": extensions}
+                if variables:
+                    payload["variables"] = variables
+                response = await client.post(
+                    UNRAID_API_URL, content=orjson.dumps(payload), headers=headers, timeout=current_timeout
+                )
+                response.raise_for_status()
+                response_data = orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            if persisted_hash is None:
+                raise  # Not an APQ attempt; the caller's full body genuinely failed
+            if e.response.status_code >= 500:
+                # Server trouble, not an APQ verdict; count it towards the
+                # breaker and retry this call with the full query, leaving
+                # APQ enabled for later calls
+                _record_request_failure()
+                logger.debug(
+                    f"Hash-only persisted query got HTTP {e.response.status_code}; "
+                    "retrying with the full query"
+                )
+            else:
+                # Some servers answer a body without 'query' with a 4xx
+                # instead of Apollo's 200 + PersistedQueryNotFound; treat
+                # that as no APQ support and retry with the full document
+                logger.debug(
+                    f"Hash-only persisted query got HTTP {e.response.status_code}; "
+                    "disabling APQ and retrying with the full query"
+                )
+                _apq_supported = False
+                extensions = None
+            response_data = None
+
+        if response_data is not None:
+            apq_status = _check_persisted_query_errors(response_data)
+            if apq_status == "not_supported":
+                logger.debug("Server does not support persisted queries; disabling APQ")
+                _apq_supported = False
+                extensions = None
+            if apq_status is not None:
+                response_data = None  # Fall through to the full-query request
+
+        if response_data is None:
+            payload = {"query": query}
+            if variables:
+                payload["variables"] = variables
+            if extensions:
+                # Registers the hash server-side so later calls can go hash-only
+                payload["extensions"] = extensions
+            response = await client.post(
+                UNRAID_API_URL, content=orjson.dumps(payload), headers=headers, timeout=current_timeout
+            )
             response.raise_for_status()  # Raise an exception for HTTP error codes 4xx/5xx
+            response_data = orjson.loads(response.content)
+
+        if "errors" in response_data and response_data["errors"]:
+            error_details = "; ".join([err.get("message", str(err)) for err in response_data["errors"]])
+
+            # Check if this is an idempotent error that should be treated as success
+            if operation_context and operation_context.get('operation'):
+                operation = operation_context['operation']
+                if is_idempotent_error(error_details, operation):
+                    logger.warning(f"Idempotent operation '{operation}' - treating as success: {error_details}")
+                    # Return a success response with the current state information
+                    return {
+                        "idempotent_success": True,
+                        "operation": operation,
+                        "message": error_details,
+                        "original_errors": response_data["errors"]
+                    }
+
+            logger.error(f"GraphQL API returned errors: {response_data['errors']}")
+            # Use ToolError for GraphQL errors to provide better feedback to LLM
+            raise ToolError(f"GraphQL API error: {error_details}")
+
+        _record_request_success()
+        logger.debug("GraphQL request successful.")
+        data = response_data.get("data", {})
+        return data if isinstance(data, dict) else {}  # Ensure we return dict
+
+    except httpx.HTTPStatusError as e:
+        # 4xx means the backend is up and answering; only 5xx counts
+        # towards opening the circuit breaker
+        if e.response.status_code >= 500:
+            _record_request_failure()
+        logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
+        raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}") from e
+    except httpx.RequestError as e:
+        _record_request_failure()
+        logger.error(f"Request error occurred: {e}")
+        raise ToolError(f"Network connection error: {str(e)}", retryable=True) from e
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Failed to decode JSON response: {e}")
+        raise ToolError(f"Invalid JSON response from Unraid API: {str(e)}") from e
+
+
+async def make_graphql_batch(
+    operations: list[dict[str, Any]],
+    custom_timeout: httpx.Timeout | None = None,
+    raw_body: bytes | None = None
+) -> list[dict[str, Any] | Exception]:
+    """Make a batched GraphQL request (Apollo-style array batching) to the Unraid API.
+
+    Posts a JSON array of operations to the GraphQL endpoint so the server can
+    execute them as independent named operations in a single HTTP round-trip.
+
+    Args:
+        operations: List of operation dicts, each with at least a 'query' key
+                    and optionally 'operationName' and 'variables'
+        custom_timeout: Optional custom timeout configuration
+        raw_body: Optional pre-encoded JSON array body matching operations,
+                  skipping per-call encoding for static batches
+
+    Returns:
+        List with one entry per operation, in order: the operation's 'data' dict
+        on success, or a ToolError instance if that operation returned errors.
+        A failed operation degrades only its own slot, not the whole batch.
+
+    Raises:
+        ToolError: For HTTP errors, network errors, or malformed responses
+                   affecting the entire batch
+    """
+    if not UNRAID_API_URL:
+        raise ToolError("UNRAID_API_URL not configured")
+
+    if not UNRAID_API_KEY:
+        raise ToolError("UNRAID_API_KEY not configured")
+
+    _check_circuit()
+
+    headers = {
+        "Content-Type": "application/json",
+        "X-API-Key": UNRAID_API_KEY,
+        "User-Agent": "UnraidMCPServer/0.1.0"
+    }
+
+    logger.debug(f"Making batched GraphQL request ({len(operations)} operations) to {UNRAID_API_URL}")
+
+    current_timeout = custom_timeout if custom_timeout is not None else DEFAULT_TIMEOUT
+
+    try:
+        client = get_shared_client()
+        response = await client.post(
+            UNRAID_API_URL,
+            content=raw_body if raw_body is not None else orjson.dumps(operations),
+            headers=headers,
+            timeout=current_timeout
+        )
+        response.raise_for_status()
+
+        response_data = orjson.loads(response.content)
+        if not isinstance(response_data, list) or len(response_data) != len(operations):
+            raise ToolError(
+                f"Unraid API did not return a matching batch response "
+                f"(expected {len(operations)} results, got "
+                f"{len(response_data) if isinstance(response_data, list) else type(response_data).__name__})"
+            )
+
+        results: list[dict[str, Any] | Exception] = []
+        for operation, entry in zip(operations, response_data, strict=True):
+            if "errors" in entry and entry["errors"]:
+                error_details = "; ".join([err.get("message", str(err)) for err in entry["errors"]])
+                operation_name = operation.get("operationName", "unnamed")
+                logger.error(f"GraphQL batch operation '{operation_name}' returned errors: {entry['errors']}")
+                results.append(ToolError(f"GraphQL API error in '{operation_name}': {error_details}"))
+            else:
+                data = entry.get("data", {})
+                results.append(data if isinstance(data, dict) else {})
 
-            response_data = response.json()
-            if "errors" in response_data and response_data["errors"]:
-                error_details = "; ".join([err.get("message", str(err)) for err in response_data["errors"]])
-
-                # Check if this is an idempotent error that should be treated as success
-                if operation_context and operation_context.get('operation'):
-                    operation = operation_context['operation']
-                    if is_idempotent_error(error_details, operation):
-                        logger.warning(f"Idempotent operation '{operation}' - treating as success: {error_details}")
-                        # Return a success response with the current state information
-                        return {
-                            "idempotent_success": True,
-                            "operation": operation,
-                            "message": error_details,
-                            "original_errors": response_data["errors"]
-                        }
-
-                logger.error(f"GraphQL API returned errors: {response_data['errors']}")
-                # Use ToolError for GraphQL errors to provide better feedback to LLM
-                raise ToolError(f"GraphQL API error: {error_details}")
-
-            logger.debug("GraphQL request successful.")
-            data = response_data.get("data", {})
-            return data if isinstance(data, dict) else {}  # Ensure we return dict
+        _record_request_success()
+        logger.debug("Batched GraphQL request successful.")
+        return results
 
     except httpx.HTTPStatusError as e:
+        # A 4xx here usually means the server rejects array batching, not
+        # that the backend is down; only 5xx counts towards the breaker
+        if e.response.status_code >= 500:
+            _record_request_failure()
         logger.error(f"HTTP error occurred: {e.response.status_code} - {e.response.text}")
         raise ToolError(f"HTTP error {e.response.status_code}: {e.response.text}") from e
     except httpx.RequestError as e:
+        _record_request_failure()
         logger.error(f"Request error occurred: {e}")
-        raise ToolError(f"Network connection error: {str(e)}") from e
-    except json.JSONDecodeError as e:
+        raise ToolError(f"Network connection error: {str(e)}", retryable=True) from e
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to decode JSON response: {e}")
         raise ToolError(f"Invalid JSON response from Unraid API: {str(e)}") from e
 
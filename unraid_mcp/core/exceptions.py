@@ -4,6 +4,8 @@ This module defines custom exception classes for consistent error handling
 throughout the application, with proper integration to FastMCP's error system.
 """
 
+from typing import Any
+
 from fastmcp.exceptions import ToolError as FastMCPToolError
 
 
@@ -14,8 +16,15 @@ class ToolError(FastMCPToolError):
     errors that should be presented to the user/LLM in a friendly way.
 
     Inherits from FastMCP's ToolError to ensure proper MCP protocol handling.
+
+    Attributes:
+        retryable: True for transient failures (timeouts, dropped connections)
+                   that a client may reasonably retry; False for terminal ones.
     """
-    pass
+
+    def __init__(self, *args: Any, retryable: bool = False) -> None:
+        super().__init__(*args)
+        self.retryable = retryable
 
 
 class ConfigurationError(ToolError):
@@ -28,6 +37,16 @@ class UnraidAPIError(ToolError):
     pass
 
 
+class CircuitOpenError(UnraidAPIError):
+    """Raised when the API circuit breaker is open and requests fail fast.
+
+    After several consecutive network/HTTP failures the GraphQL client stops
+    contacting the Unraid API for a short cooldown instead of hammering a
+    dead backend; callers see this error without an upstream request.
+    """
+    pass
+
+
 class SubscriptionError(ToolError):
     """Raised when there are WebSocket subscription-related errors."""
     pass
@@ -5,6 +5,7 @@ separate modules for configuration, core functionality, subscriptions, and tools
 """
 
 import sys
+import threading
 
 from fastmcp import FastMCP
 
@@ -16,15 +17,7 @@ from .config.settings import (
     UNRAID_MCP_PORT,
     UNRAID_MCP_TRANSPORT,
 )
-from .subscriptions.diagnostics import register_diagnostic_tools
 from .subscriptions.manager import SubscriptionManager
-from .subscriptions.resources import register_subscription_resources
-from .tools.docker import register_docker_tools
-from .tools.health import register_health_tools
-from .tools.rclone import register_rclone_tools
-from .tools.storage import register_storage_tools
-from .tools.system import register_system_tools
-from .tools.virtualization import register_vm_tools
 
 # Initialize FastMCP instance
 mcp = FastMCP(
@@ -46,51 +39,75 @@ async def autostart_subscriptions() -> None:
         await subscription_manager.auto_start_all_subscriptions()
         logger.info("[AUTOSTART] Auto-start process completed successfully")
     except Exception as e:
-        logger.error(f"[AUTOSTART] Failed during auto-start process: {e}", exc_info=True)
+        logger.error("[AUTOSTART] Failed during auto-start process: %s", e, exc_info=True)
 
 
-def register_all_modules() -> None:
-    """Register all tools and resources with the MCP instance."""
+def register_all_modules() -> list[str]:
+    """Register all tools and resources with the MCP instance.
+
+    Tool modules are imported here rather than at module top so that importing
+    the server (e.g. for configuration inspection) stays cheap; the heavy tool
+    modules only load when the server actually starts.
+
+    Returns:
+        Status messages describing what was registered, so the caller can
+        log them off the startup critical path.
+    """
+    messages: list[str] = []
     try:
+        from .subscriptions.diagnostics import register_diagnostic_tools
+        from .subscriptions.resources import register_subscription_resources
+        from .tools.docker import register_docker_tools
+        from .tools.health import register_health_tools
+        from .tools.rclone import register_rclone_tools
+        from .tools.storage import register_storage_tools
+        from .tools.system import register_system_tools
+        from .tools.virtualization import register_vm_tools
+
         # Register subscription resources first
         register_subscription_resources(mcp)
-        logger.info("📊 Subscription resources registered")
+        messages.append("📊 Subscription resources registered")
 
         # Register diagnostic tools
         register_diagnostic_tools(mcp)
-        logger.info("🔧 Diagnostic tools registered")
+        messages.append("🔧 Diagnostic tools registered")
 
         # Register all tool categories
         register_system_tools(mcp)
-        logger.info("🖥️  System tools registered")
+        messages.append("🖥️  System tools registered")
 
         register_docker_tools(mcp)
-        logger.info("🐳 Docker tools registered")
+        messages.append("🐳 Docker tools registered")
 
         register_vm_tools(mcp)
-        logger.info("💻 Virtualization tools registered")
+        messages.append("💻 Virtualization tools registered")
 
         register_storage_tools(mcp)
-        logger.info("💾 Storage tools registered")
+        messages.append("💾 Storage tools registered")
 
         register_health_tools(mcp)
-        logger.info("🏥 Health tools registered")
+        messages.append("🏥 Health tools registered")
 
         register_rclone_tools(mcp)
-        logger.info("☁️  RClone tools registered")
+        messages.append("☁️  RClone tools registered")
 
-        logger.info("🎯 All modules registered successfully - Server ready!")
+        messages.append("🎯 All modules registered successfully - Server ready!")
+        return messages
 
     except Exception as e:
-        logger.error(f"❌ Failed to register modules: {e}", exc_info=True)
+        logger.error("❌ Failed to register modules: %s", e, exc_info=True)
         raise
 
 
-def run_server() -> None:
-    """Run the MCP server with the configured transport."""
-    # Log configuration
+def _emit_startup_banner(registration_messages: list[str]) -> None:
+    """Log configuration and registration status.
+
+    Runs on a daemon thread so a dozen file-synced log writes (slow on the
+    Unraid flash drive) don't delay the transport coming up. Error and
+    critical logging stays synchronous on the main thread.
+    """
     if UNRAID_API_URL:
-        logger.info(f"UNRAID_API_URL loaded: {UNRAID_API_URL[:20]}...")
+        logger.info("UNRAID_API_URL loaded: %s...", UNRAID_API_URL[:20])
     else:
         logger.warning("UNRAID_API_URL not found in environment or .env file.")
 
@@ -99,14 +116,28 @@ def run_server() -> None:
     else:
         logger.warning("UNRAID_API_KEY not found in environment or .env file.")
 
-    logger.info(f"UNRAID_MCP_PORT set to: {UNRAID_MCP_PORT}")
-    logger.info(f"UNRAID_MCP_HOST set to: {UNRAID_MCP_HOST}")
-    logger.info(f"UNRAID_MCP_TRANSPORT set to: {UNRAID_MCP_TRANSPORT}")
+    logger.info("UNRAID_MCP_PORT set to: %s", UNRAID_MCP_PORT)
+    logger.info("UNRAID_MCP_HOST set to: %s", UNRAID_MCP_HOST)
+    logger.info("UNRAID_MCP_TRANSPORT set to: %s", UNRAID_MCP_TRANSPORT)
+
+    for message in registration_messages:
+        logger.info(message)
+
+    logger.info("🚀 Starting Unraid MCP Server on %s:%s using %s transport...",
+                UNRAID_MCP_HOST, UNRAID_MCP_PORT, UNRAID_MCP_TRANSPORT)
 
-    # Register all modules
-    register_all_modules()
 
-    logger.info(f"🚀 Starting Unraid MCP Server on {UNRAID_MCP_HOST}:{UNRAID_MCP_PORT} using {UNRAID_MCP_TRANSPORT} transport...")
+def run_server() -> None:
+    """Run the MCP server with the configured transport."""
+    # Register all modules, then log the banner off the critical path so the
+    # main thread can proceed straight to mcp.run()
+    registration_messages = register_all_modules()
+    threading.Thread(
+        target=_emit_startup_banner,
+        args=(registration_messages,),
+        name="startup-banner",
+        daemon=True,
+    ).start()
 
     try:
         # Auto-start subscriptions on first async operation
@@ -134,7 +165,7 @@ def run_server() -> None:
             logger.error(f"Unsupported MCP_TRANSPORT: {UNRAID_MCP_TRANSPORT}. Choose 'streamable-http' (recommended), 'sse' (deprecated), or 'stdio'.")
             sys.exit(1)
     except Exception as e:
-        logger.critical(f"❌ Failed to start Unraid MCP server: {e}", exc_info=True)
+        logger.critical("❌ Failed to start Unraid MCP server: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -6,10 +6,10 @@ development and debugging purposes.
 """
 
 import asyncio
-import json
 from datetime import datetime
 from typing import Any
 
+import orjson
 import websockets
 from fastmcp import FastMCP
 from websockets.legacy.protocol import Subprotocol
@@ -58,29 +58,29 @@ def register_diagnostic_tools(mcp: FastMCP) -> None:
             ) as websocket:
 
                 # Send connection init
-                await websocket.send(json.dumps({
+                await websocket.send(orjson.dumps({
                     "type": "connection_init",
                     "payload": {"Authorization": f"Bearer {UNRAID_API_KEY}"}
-                }))
+                }).decode())
 
                 # Wait for ack
                 response = await websocket.recv()
-                init_response = json.loads(response)
+                init_response = orjson.loads(response)
 
                 if init_response.get("type") != "connection_ack":
                     return {"error": f"Connection failed: {init_response}"}
 
                 # Send subscription
-                await websocket.send(json.dumps({
+                await websocket.send(orjson.dumps({
                     "id": "test",
                     "type": "start",
                     "payload": {"query": subscription_query}
-                }))
+                }).decode())
 
                 # Wait for response with timeout
                 try:
                     response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    result = json.loads(response)
+                    result = orjson.loads(response)
 
                     logger.info(f"[TEST_SUBSCRIPTION] Response: {result}")
                     return {
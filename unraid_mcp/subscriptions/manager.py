@@ -6,11 +6,11 @@ error handling, reconnection logic, and authentication.
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime
 from typing import Any
 
+import orjson
 import websockets
 from websockets.legacy.protocol import Subprotocol
 
@@ -196,16 +196,16 @@ class SubscriptionManager:
                         logger.warning(f"[AUTH:{subscription_name}] No API key available for authentication")
 
                     logger.debug(f"[PROTOCOL:{subscription_name}] Sending connection_init message")
-                    await websocket.send(json.dumps(init_payload))
+                    await websocket.send(orjson.dumps(init_payload).decode())
 
                     # Wait for connection acknowledgment
                     logger.debug(f"[PROTOCOL:{subscription_name}] Waiting for connection_ack...")
                     init_raw = await asyncio.wait_for(websocket.recv(), timeout=30)
 
                     try:
-                        init_data = json.loads(init_raw)
+                        init_data = orjson.loads(init_raw)
                         logger.debug(f"[PROTOCOL:{subscription_name}] Received init response: {init_data.get('type')}")
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
                         init_preview = init_raw[:200] if isinstance(init_raw, str) else init_raw[:200].decode('utf-8', errors='replace')
                         logger.error(f"[PROTOCOL:{subscription_name}] Failed to decode init response: {init_preview}...")
                         self.last_error[subscription_name] = f"Invalid JSON in init response: {e}"
@@ -241,7 +241,7 @@ class SubscriptionManager:
                     logger.debug(f"[SUBSCRIPTION:{subscription_name}] Query: {query[:100]}...")
                     logger.debug(f"[SUBSCRIPTION:{subscription_name}] Variables: {variables}")
 
-                    await websocket.send(json.dumps(subscription_message))
+                    await websocket.send(orjson.dumps(subscription_message).decode())
                     logger.info(f"[SUBSCRIPTION:{subscription_name}] Subscription started successfully")
                     self.connection_states[subscription_name] = "subscribed"
 
@@ -250,7 +250,7 @@ class SubscriptionManager:
 
                     async for message in websocket:
                         try:
-                            data = json.loads(message)
+                            data = orjson.loads(message)
                             message_count += 1
                             message_type = data.get('type', 'unknown')
 
@@ -278,7 +278,7 @@ class SubscriptionManager:
 
                             elif data.get("type") == "ping":
                                 logger.debug(f"[PROTOCOL:{subscription_name}] Received ping, sending pong")
-                                await websocket.send(json.dumps({"type": "pong"}))
+                                await websocket.send(orjson.dumps({"type": "pong"}).decode())
 
                             elif data.get("type") == "error":
                                 error_payload = data.get('payload', {})
@@ -297,7 +297,7 @@ class SubscriptionManager:
                             else:
                                 logger.debug(f"[PROTOCOL:{subscription_name}] Unhandled message type: {message_type}")
 
-                        except json.JSONDecodeError as e:
+                        except orjson.JSONDecodeError as e:
                             msg_preview = message[:200] if isinstance(message, str) else message[:200].decode('utf-8', errors='replace')
                             logger.error(f"[PROTOCOL:{subscription_name}] Failed to decode message: {msg_preview}...")
                             logger.error(f"[PROTOCOL:{subscription_name}] JSON decode error: {e}")
@@ -98,7 +98,9 @@ def register_docker_tools(mcp: FastMCP) -> None:
             response_data = await make_graphql_request(query)
             if response_data.get("docker"):
                 containers = response_data["docker"].get("containers", [])
-                return list(containers) if isinstance(containers, list) else []
+                # Return the parsed list as-is; copying it would double the
+                # working set for large container fleets
+                return containers if isinstance(containers, list) else []
             return []
         except Exception as e:
             logger.error(f"Error in list_docker_containers: {e}", exc_info=True)
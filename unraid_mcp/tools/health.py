@@ -5,15 +5,159 @@ and the underlying Unraid system, including performance metrics, system status,
 notifications, Docker services, and API responsiveness.
 """
 
+import asyncio
 import datetime
+import hashlib
 import time
-from typing import Any
+from typing import Any, Final
 
+import httpx
+import orjson
 from fastmcp import FastMCP
 
 from ..config.logging import logger
 from ..config.settings import UNRAID_API_URL, UNRAID_MCP_HOST, UNRAID_MCP_PORT, UNRAID_MCP_TRANSPORT
-from ..core.client import make_graphql_request
+from ..core.cache import async_ttl_cache
+from ..core.client import make_graphql_batch, make_graphql_request
+from ..core.exceptions import CircuitOpenError, ToolError
+
+# Anchor for process uptime reporting, captured once at import
+_PROCESS_START = time.monotonic()
+
+# Second-resolution ISO timestamp cache; health polls arriving within the same
+# second reuse the formatted string instead of re-running utcnow().isoformat()
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """Return the current UTC time as an ISO-8601 string, cached per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        iso = datetime.datetime.fromtimestamp(now, tz=datetime.timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+        _ts_cache = (now, iso)
+    return _ts_cache[1]
+
+
+# Array states that don't warrant a warning in the health report
+_HEALTHY_ARRAY_STATES: Final = frozenset({"STARTED", "STOPPED"})
+
+# Health check sub-queries, batched into one HTTP request so the Unraid API can
+# execute them as independent operations and a failure in one section degrades
+# only that section instead of the whole check.
+HEALTH_INFO_QUERY: Final = """
+query HealthInfo {
+  info {
+    machineId
+    time
+    versions { core { unraid } }
+    os { uptime }
+  }
+}
+"""
+
+HEALTH_ARRAY_QUERY: Final = """
+query HealthArray {
+  array {
+    state
+  }
+}
+"""
+
+HEALTH_NOTIFICATIONS_QUERY: Final = """
+query HealthNotifications {
+  notifications {
+    overview {
+      unread { alert warning total }
+    }
+  }
+}
+"""
+
+HEALTH_DOCKER_QUERY: Final = """
+query HealthDocker {
+  docker {
+    containers(skipCache: true) {
+      state
+    }
+  }
+}
+"""
+
+# SHA-256 digests for Apollo Automatic Persisted Queries; computed once at
+# import so warm calls can send the hash instead of the full document
+HEALTH_INFO_QUERY_HASH: Final = hashlib.sha256(HEALTH_INFO_QUERY.encode()).hexdigest()
+HEALTH_ARRAY_QUERY_HASH: Final = hashlib.sha256(HEALTH_ARRAY_QUERY.encode()).hexdigest()
+HEALTH_NOTIFICATIONS_QUERY_HASH: Final = hashlib.sha256(HEALTH_NOTIFICATIONS_QUERY.encode()).hexdigest()
+HEALTH_DOCKER_QUERY_HASH: Final = hashlib.sha256(HEALTH_DOCKER_QUERY.encode()).hexdigest()
+
+HEALTH_BATCH_OPERATIONS: Final = [
+    {"query": HEALTH_INFO_QUERY, "operationName": "HealthInfo"},
+    {"query": HEALTH_ARRAY_QUERY, "operationName": "HealthArray"},
+    {"query": HEALTH_NOTIFICATIONS_QUERY, "operationName": "HealthNotifications"},
+    {"query": HEALTH_DOCKER_QUERY, "operationName": "HealthDocker"},
+]
+
+# Hashes aligned with HEALTH_BATCH_OPERATIONS for the concurrent fallback path
+HEALTH_BATCH_QUERY_HASHES: Final = [
+    HEALTH_INFO_QUERY_HASH,
+    HEALTH_ARRAY_QUERY_HASH,
+    HEALTH_NOTIFICATIONS_QUERY_HASH,
+    HEALTH_DOCKER_QUERY_HASH,
+]
+
+# Request body for the batch is static, so encode it once at import
+HEALTH_BATCH_BODY: Final = orjson.dumps(HEALTH_BATCH_OPERATIONS)
+
+# Whether the Unraid API accepts array batching; flipped to False on the first
+# rejection so subsequent health checks go straight to the concurrent fallback.
+_batching_supported = True
+
+
+@async_ttl_cache(3.0, name="health.sections")
+async def _fetch_health_sections() -> list[dict[str, Any] | Exception]:
+    """Fetch the four health sub-queries, preferring one batched request.
+
+    Results are cached for a few seconds so duplicate polls from monitoring
+    clients share one upstream request.
+
+    Falls back to issuing the sub-queries as concurrent individual requests
+    (overlapping resolver work server-side) if the API rejects array batching.
+
+    Returns:
+        List of four results in batch order: the operation's data dict on
+        success, or the exception that failed that operation.
+    """
+    global _batching_supported
+
+    if _batching_supported:
+        try:
+            return await make_graphql_batch(HEALTH_BATCH_OPERATIONS, raw_body=HEALTH_BATCH_BODY)
+        except CircuitOpenError:
+            # Breaker is open; retrying without batching would hit it too
+            raise
+        except ToolError as e:
+            # Only an actual batching rejection (a non-5xx HTTP answer) should
+            # latch the fallback; transient network or server errors would hit
+            # the sub-queries too and may clear on the next poll.
+            cause = e.__cause__
+            transient = e.retryable or (
+                isinstance(cause, httpx.HTTPStatusError) and cause.response.status_code >= 500
+            )
+            if transient:
+                logger.warning("Batched health query failed transiently, using concurrent sub-queries this round: %s", e)
+            else:
+                logger.warning("Batched health query rejected, falling back to concurrent sub-queries: %s", e)
+                _batching_supported = False
+
+    results = await asyncio.gather(
+        *(make_graphql_request(operation["query"], persisted_hash=query_hash)
+          for operation, query_hash in zip(HEALTH_BATCH_OPERATIONS, HEALTH_BATCH_QUERY_HASHES, strict=True)),
+        return_exceptions=True
+    )
+    return [r if isinstance(r, (dict, Exception)) else {} for r in results]
 
 
 def register_health_tools(mcp: FastMCP) -> None:
@@ -26,45 +170,22 @@ def register_health_tools(mcp: FastMCP) -> None:
     @mcp.tool()
     async def health_check() -> dict[str, Any]:
         """Returns comprehensive health status of the Unraid MCP server and system for monitoring purposes."""
-        start_time = time.time()
+        start_time = time.monotonic()
         health_status = "healthy"
         issues = []
 
         try:
-            # Enhanced health check with multiple system components
-            comprehensive_query = """
-            query ComprehensiveHealthCheck {
-              info {
-                machineId
-                time
-                versions { core { unraid } }
-                os { uptime }
-              }
-              array {
-                state
-              }
-              notifications {
-                overview {
-                  unread { alert warning total }
-                }
-              }
-              docker {
-                containers(skipCache: true) {
-                  id
-                  state
-                  status
-                }
-              }
-            }
-            """
-
-            response_data = await make_graphql_request(comprehensive_query)
-            api_latency = round((time.time() - start_time) * 1000, 2)  # ms
+            # Enhanced health check with multiple system components, fetched as
+            # one batched HTTP request (or concurrent sub-queries as fallback)
+            # with independent per-section operations
+            info_result, array_result, notifications_result, docker_result = \
+                await _fetch_health_sections()
+            api_latency = round((time.monotonic() - start_time) * 1000, 2)  # ms
 
             # Base health info
             health_info = {
                 "status": health_status,
-                "timestamp": datetime.datetime.utcnow().isoformat(),
+                "timestamp": _iso_now(),
                 "api_latency_ms": api_latency,
                 "server": {
                     "name": "Unraid MCP Server",
@@ -72,11 +193,12 @@ def register_health_tools(mcp: FastMCP) -> None:
                     "transport": UNRAID_MCP_TRANSPORT,
                     "host": UNRAID_MCP_HOST,
                     "port": UNRAID_MCP_PORT,
-                    "process_uptime_seconds": time.time() - start_time  # Rough estimate
+                    "process_uptime_seconds": round(time.monotonic() - _PROCESS_START, 2)
                 }
             }
 
-            if not response_data:
+            if all(isinstance(r, Exception) for r in
+                   (info_result, array_result, notifications_result, docker_result)):
                 health_status = "unhealthy"
                 issues.append("No response from Unraid API")
                 health_info["status"] = health_status
@@ -84,7 +206,7 @@ def register_health_tools(mcp: FastMCP) -> None:
                 return health_info
 
             # System info analysis
-            info = response_data.get("info", {})
+            info = info_result.get("info", {}) if not isinstance(info_result, Exception) else {}
             if info:
                 health_info["unraid_system"] = {
                     "status": "connected",
@@ -99,14 +221,15 @@ def register_health_tools(mcp: FastMCP) -> None:
                 issues.append("Unable to retrieve system info")
 
             # Array health analysis
-            array_info = response_data.get("array", {})
+            array_info = array_result.get("array", {}) if not isinstance(array_result, Exception) else {}
             if array_info:
                 array_state = array_info.get("state", "unknown")
+                array_healthy = array_state in _HEALTHY_ARRAY_STATES
                 health_info["array_status"] = {
                     "state": array_state,
-                    "healthy": array_state in ["STARTED", "STOPPED"]
+                    "healthy": array_healthy
                 }
-                if array_state not in ["STARTED", "STOPPED"]:
+                if not array_healthy:
                     health_status = "warning"
                     issues.append(f"Array in unexpected state: {array_state}")
             else:
@@ -114,7 +237,8 @@ def register_health_tools(mcp: FastMCP) -> None:
                 issues.append("Unable to retrieve array status")
 
             # Notifications analysis
-            notifications = response_data.get("notifications", {})
+            notifications = (notifications_result.get("notifications", {})
+                             if not isinstance(notifications_result, Exception) else {})
             if notifications and notifications.get("overview"):
                 unread = notifications["overview"].get("unread", {})
                 alert_count = unread.get("alert", 0)
@@ -133,17 +257,20 @@ def register_health_tools(mcp: FastMCP) -> None:
                     issues.append(f"{alert_count} unread alert notification(s)")
 
             # Docker services analysis
-            docker_info = response_data.get("docker", {})
+            docker_info = docker_result.get("docker", {}) if not isinstance(docker_result, Exception) else {}
             if docker_info and docker_info.get("containers"):
                 containers = docker_info["containers"]
-                running_containers = [c for c in containers if c.get("state") == "running"]
-                stopped_containers = [c for c in containers if c.get("state") == "exited"]
+                # Single pass over the container list; bools count as 0/1
+                running = stopped = 0
+                for container in containers:
+                    state = container.get("state")
+                    running += state == "running"
+                    stopped += state == "exited"
 
                 health_info["docker_services"] = {
                     "total_containers": len(containers),
-                    "running_containers": len(running_containers),
-                    "stopped_containers": len(stopped_containers),
-                    "containers_healthy": len([c for c in containers if c.get("status", "").startswith("Up")])
+                    "running_containers": running,
+                    "stopped_containers": stopped
                 }
 
             # API performance assessment
@@ -159,21 +286,38 @@ def register_health_tools(mcp: FastMCP) -> None:
             if issues:
                 health_info["issues"] = issues
 
-            # Add performance metrics
+            # Add performance metrics (single clock read for the total duration)
+            end = time.monotonic()
             health_info["performance"] = {
                 "api_response_time_ms": api_latency,
-                "health_check_duration_ms": round((time.time() - start_time) * 1000, 2)
+                "health_check_duration_ms": round((end - start_time) * 1000, 2)
             }
 
             return health_info
 
+        except CircuitOpenError as e:
+            # Breaker is open: fail fast without touching the backend
+            logger.warning("Health check short-circuited: %s", e)
+            return {
+                "status": "unhealthy",
+                "timestamp": _iso_now(),
+                "error": str(e),
+                "server": {
+                    "name": "Unraid MCP Server",
+                    "version": "0.1.0",
+                    "transport": UNRAID_MCP_TRANSPORT,
+                    "host": UNRAID_MCP_HOST,
+                    "port": UNRAID_MCP_PORT
+                }
+            }
+
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return {
                 "status": "unhealthy",
-                "timestamp": datetime.datetime.utcnow().isoformat(),
+                "timestamp": _iso_now(),
                 "error": str(e),
-                "api_latency_ms": round((time.time() - start_time) * 1000, 2) if 'start_time' in locals() else None,
+                "api_latency_ms": round((time.monotonic() - start_time) * 1000, 2) if 'start_time' in locals() else None,
                 "server": {
                     "name": "Unraid MCP Server",
                     "version": "0.1.0",
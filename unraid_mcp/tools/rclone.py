@@ -5,14 +5,96 @@ remotes, getting configuration forms, creating new remotes, and deleting remotes
 for various cloud storage providers (S3, Google Drive, Dropbox, FTP, etc.).
 """
 
-from typing import Any
+import hashlib
+from typing import Any, Final
 
+import orjson
 from fastmcp import FastMCP
 
 from ..config.logging import logger
+from ..core.cache import async_ttl_cache, invalidate_cache
 from ..core.client import make_graphql_request
 from ..core.exceptions import ToolError
 
+# Cache name for the remote list; mutations invalidate it so reads stay fresh
+_REMOTES_CACHE: Final = "rclone.list_remotes"
+
+# Config form schemas are effectively static per provider for the lifetime of
+# the process (an rclone binary change implies a restart), so cache them with
+# no TTL and skip the GraphQL round-trip on repeat lookups
+_FORM_CACHE: dict[str, dict[str, Any]] = {}
+
+LIST_RCLONE_REMOTES_QUERY: Final = """
+query ListRCloneRemotes {
+    rclone {
+        remotes {
+            name
+            type
+            parameters
+            config
+        }
+    }
+}
+"""
+LIST_RCLONE_REMOTES_QUERY_HASH: Final = hashlib.sha256(LIST_RCLONE_REMOTES_QUERY.encode()).hexdigest()
+# Parameter-free query, so the hash-only APQ request body is static; encode it
+# once at import and let make_graphql_request send it as-is
+LIST_RCLONE_REMOTES_BODY: Final = orjson.dumps(
+    {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": LIST_RCLONE_REMOTES_QUERY_HASH}}}
+)
+
+GET_RCLONE_CONFIG_FORM_QUERY: Final = """
+query GetRCloneConfigForm($formOptions: RCloneConfigFormInput) {
+    rclone {
+        configForm(formOptions: $formOptions) {
+            id
+            dataSchema
+            uiSchema
+        }
+    }
+}
+"""
+GET_RCLONE_CONFIG_FORM_QUERY_HASH: Final = hashlib.sha256(GET_RCLONE_CONFIG_FORM_QUERY.encode()).hexdigest()
+
+CREATE_RCLONE_REMOTE_MUTATION: Final = """
+mutation CreateRCloneRemote($input: CreateRCloneRemoteInput!) {
+    rclone {
+        createRCloneRemote(input: $input) {
+            name
+            type
+            parameters
+        }
+    }
+}
+"""
+CREATE_RCLONE_REMOTE_MUTATION_HASH: Final = hashlib.sha256(CREATE_RCLONE_REMOTE_MUTATION.encode()).hexdigest()
+
+DELETE_RCLONE_REMOTE_MUTATION: Final = """
+mutation DeleteRCloneRemote($input: DeleteRCloneRemoteInput!) {
+    rclone {
+        deleteRCloneRemote(input: $input)
+    }
+}
+"""
+DELETE_RCLONE_REMOTE_MUTATION_HASH: Final = hashlib.sha256(DELETE_RCLONE_REMOTE_MUTATION.encode()).hexdigest()
+
+
+@async_ttl_cache(30.0, name=_REMOTES_CACHE)
+async def _list_rclone_remotes() -> list[dict[str, Any]]:
+    """Standalone function to list RClone remotes - cached for polling clients."""
+    response_data = await make_graphql_request(
+        LIST_RCLONE_REMOTES_QUERY,
+        persisted_hash=LIST_RCLONE_REMOTES_QUERY_HASH,
+        raw_body=LIST_RCLONE_REMOTES_BODY
+    )
+
+    if "rclone" in response_data and "remotes" in response_data["rclone"]:
+        remotes = response_data["rclone"]["remotes"]
+        logger.info("Retrieved %d RClone remotes", len(remotes))
+        return list(remotes) if isinstance(remotes, list) else []
+
+    return []
+
 
 def register_rclone_tools(mcp: FastMCP) -> None:
     """Register all RClone tools with the FastMCP instance.
@@ -25,66 +107,47 @@ def register_rclone_tools(mcp: FastMCP) -> None:
     async def list_rclone_remotes() -> list[dict[str, Any]]:
         """Retrieves all configured RClone remotes with their configuration details."""
         try:
-            query = """
-            query ListRCloneRemotes {
-                rclone {
-                    remotes {
-                        name
-                        type
-                        parameters
-                        config
-                    }
-                }
-            }
-            """
-
-            response_data = await make_graphql_request(query)
-
-            if "rclone" in response_data and "remotes" in response_data["rclone"]:
-                remotes = response_data["rclone"]["remotes"]
-                logger.info(f"Retrieved {len(remotes)} RClone remotes")
-                return list(remotes) if isinstance(remotes, list) else []
-
-            return []
-
-        except Exception as e:
-            logger.error(f"Failed to list RClone remotes: {str(e)}")
+            return await _list_rclone_remotes()
+        except ToolError:
+            # Already logged and shaped for the client in core.client
+            raise
+        except (KeyError, TypeError) as e:
+            logger.error("Malformed RClone remotes response: %s", e)
             raise ToolError(f"Failed to list RClone remotes: {str(e)}") from e
 
     @mcp.tool()
-    async def get_rclone_config_form(provider_type: str) -> dict[str, Any]:
+    async def get_rclone_config_form(provider_type: str, refresh: bool = False) -> dict[str, Any]:
         """
         Get RClone configuration form schema for setting up new remotes.
 
         Args:
             provider_type: Provider type to get form for (e.g., 's3', 'drive', 'dropbox', 'ftp')
+            refresh: Bypass the cached schema and re-fetch it from the API
         """
         try:
-            query = """
-            query GetRCloneConfigForm($formOptions: RCloneConfigFormInput) {
-                rclone {
-                    configForm(formOptions: $formOptions) {
-                        id
-                        dataSchema
-                        uiSchema
-                    }
-                }
-            }
-            """
+            if not refresh and provider_type in _FORM_CACHE:
+                return _FORM_CACHE[provider_type]
 
             variables = {"formOptions": {"providerType": provider_type}}
 
-            response_data = await make_graphql_request(query, variables)
+            response_data = await make_graphql_request(
+                GET_RCLONE_CONFIG_FORM_QUERY, variables,
+                persisted_hash=GET_RCLONE_CONFIG_FORM_QUERY_HASH
+            )
 
             if "rclone" in response_data and "configForm" in response_data["rclone"]:
                 form_data = response_data["rclone"]["configForm"]
-                logger.info(f"Retrieved RClone config form for {provider_type or 'general'}")
-                return dict(form_data) if isinstance(form_data, dict) else {}
+                logger.info("Retrieved RClone config form for %s", provider_type or "general")
+                form = dict(form_data) if isinstance(form_data, dict) else {}
+                _FORM_CACHE[provider_type] = form
+                return form
 
             raise ToolError("No RClone config form data received")
 
-        except Exception as e:
-            logger.error(f"Failed to get RClone config form: {str(e)}")
+        except ToolError:
+            raise
+        except (KeyError, TypeError) as e:
+            logger.error("Malformed RClone config form response: %s", e)
             raise ToolError(f"Failed to get RClone config form: {str(e)}") from e
 
     @mcp.tool()
@@ -98,18 +161,6 @@ def register_rclone_tools(mcp: FastMCP) -> None:
             config_data: Configuration parameters specific to the provider type
         """
         try:
-            mutation = """
-            mutation CreateRCloneRemote($input: CreateRCloneRemoteInput!) {
-                rclone {
-                    createRCloneRemote(input: $input) {
-                        name
-                        type
-                        parameters
-                    }
-                }
-            }
-            """
-
             variables = {
                 "input": {
                     "name": name,
@@ -118,11 +169,15 @@ def register_rclone_tools(mcp: FastMCP) -> None:
                 }
             }
 
-            response_data = await make_graphql_request(mutation, variables)
+            response_data = await make_graphql_request(
+                CREATE_RCLONE_REMOTE_MUTATION, variables,
+                persisted_hash=CREATE_RCLONE_REMOTE_MUTATION_HASH
+            )
 
             if "rclone" in response_data and "createRCloneRemote" in response_data["rclone"]:
                 remote_info = response_data["rclone"]["createRCloneRemote"]
-                logger.info(f"Successfully created RClone remote: {name}")
+                invalidate_cache(_REMOTES_CACHE)
+                logger.info("Successfully created RClone remote: %s", name)
                 return {
                     "success": True,
                     "message": f"RClone remote '{name}' created successfully",
@@ -131,8 +186,10 @@ def register_rclone_tools(mcp: FastMCP) -> None:
 
             raise ToolError("Failed to create RClone remote")
 
-        except Exception as e:
-            logger.error(f"Failed to create RClone remote {name}: {str(e)}")
+        except ToolError:
+            raise
+        except (KeyError, TypeError) as e:
+            logger.error("Malformed response creating RClone remote %s: %s", name, e)
             raise ToolError(f"Failed to create RClone remote {name}: {str(e)}") from e
 
     @mcp.tool()
@@ -144,24 +201,20 @@ def register_rclone_tools(mcp: FastMCP) -> None:
             name: Name of the remote to delete
         """
         try:
-            mutation = """
-            mutation DeleteRCloneRemote($input: DeleteRCloneRemoteInput!) {
-                rclone {
-                    deleteRCloneRemote(input: $input)
-                }
-            }
-            """
-
             variables = {
                 "input": {
                     "name": name
                 }
             }
 
-            response_data = await make_graphql_request(mutation, variables)
+            response_data = await make_graphql_request(
+                DELETE_RCLONE_REMOTE_MUTATION, variables,
+                persisted_hash=DELETE_RCLONE_REMOTE_MUTATION_HASH
+            )
 
             if "rclone" in response_data and response_data["rclone"]["deleteRCloneRemote"]:
-                logger.info(f"Successfully deleted RClone remote: {name}")
+                invalidate_cache(_REMOTES_CACHE)
+                logger.info("Successfully deleted RClone remote: %s", name)
                 return {
                     "success": True,
                     "message": f"RClone remote '{name}' deleted successfully"
@@ -169,8 +222,10 @@ def register_rclone_tools(mcp: FastMCP) -> None:
 
             raise ToolError(f"Failed to delete RClone remote '{name}'")
 
-        except Exception as e:
-            logger.error(f"Failed to delete RClone remote {name}: {str(e)}")
+        except ToolError:
+            raise
+        except (KeyError, TypeError) as e:
+            logger.error("Malformed response deleting RClone remote %s: %s", name, e)
             raise ToolError(f"Failed to delete RClone remote {name}: {str(e)}") from e
 
     logger.info("RClone tools registered successfully")
@@ -5,205 +5,481 @@ array status with health analysis, network configuration, registration info,
 and system variables.
 """
 
-from typing import Any
+import asyncio
+import functools
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal, ParamSpec, TypeVar
 
 from fastmcp import FastMCP
 
 from ..config.logging import logger
+from ..core import batcher
+from ..core.cache import async_ttl_cache
 from ..core.client import make_graphql_request
 from ..core.exceptions import ToolError
 
+# Cache names, so subscription resources can push fresh data in via
+# core.cache.invalidate_cache when a live event supersedes a cached snapshot
+INFO_CACHE = "system.info"
+VARS_CACHE = "system.vars"
+NETWORK_CACHE = "system.network"
+REGISTRATION_CACHE = "system.registration"
+
+# Top-level selection sets for the shared query batcher. Tools request these
+# by field name; calls landing in the same event-loop tick are merged into a
+# single combined query so multi-tool agent turns pay one round-trip.
+# Lean selection covers exactly what the summary consumes; the full variant
+# adds the long tail (cpu.flags, DIMM serials, package versions, ...) for
+# callers that opt into detail_level="full". Resolver cost on the Unraid side
+# scales with field count, so the default avoids paying for unread data.
+INFO_SELECTION = """
+  info {
+    os { platform distro release arch hostname uptime }
+    cpu { manufacturer brand threads cores }
+    memory {
+      layout { bank type clockSpeed manufacturer partNum size }
+    }
+    versions { core { unraid api kernel } }
+    machineId
+    time
+  }
+"""
 
-# Standalone functions for use by subscription resources
-async def _get_system_info() -> dict[str, Any]:
-    """Standalone function to get system info - used by subscriptions and tools."""
-    query = """
-    query GetSystemInfo {
-      info {
-        os { platform distro release codename kernel arch hostname fqdn servicepack uefi logofile serial build uptime }
-        cpu { manufacturer brand vendor family model stepping revision threads cores processors socket cache flags }
-        memory {
-          layout { bank type clockSpeed formFactor manufacturer partNum serialNum size }
-        }
-        baseboard { manufacturer model version serial assetTag }
-        system { manufacturer model version serial uuid sku }
-        versions {
-          core { unraid api kernel }
-          packages { openssl node npm pm2 git nginx php docker }
-        }
-        machineId
-        time
-      }
+INFO_FULL_SELECTION = """
+  info {
+    os { platform distro release codename kernel arch hostname fqdn servicepack uefi logofile serial build uptime }
+    cpu { manufacturer brand vendor family model stepping revision threads cores processors socket cache flags }
+    memory {
+      layout { bank type clockSpeed formFactor manufacturer partNum serialNum size }
+    }
+    baseboard { manufacturer model version serial assetTag }
+    system { manufacturer model version serial uuid sku }
+    versions {
+      core { unraid api kernel }
+      packages { openssl node npm pm2 git nginx php docker }
+    }
+    machineId
+    time
+  }
+"""
+
+# The summary only consumes state, kilobyte capacity, per-type disk counts,
+# and the status/warning/critical triple fed to analyze_disk_health, so the
+# counts selection asks for exactly that - roughly a tenth of the bytes of
+# the full per-disk scalar dump for large arrays.
+ARRAY_COUNTS_SELECTION = """
+  array {
+    state
+    capacity {
+      kilobytes { free used total }
+    }
+    parities { id status warning critical }
+    disks { id status warning critical }
+    caches { id status warning critical }
+  }
+"""
+
+ARRAY_FULL_SELECTION = """
+  array {
+    id
+    state
+    capacity {
+      kilobytes { free used total }
+      disks { free used total }
+    }
+    boot { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
+    parities { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
+    disks { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
+    caches { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
+  }
+"""
+
+NETWORK_SELECTION = """
+  network {
+    id
+    accessUrls { type name ipv4 ipv6 }
+  }
+"""
+
+REGISTRATION_SELECTION = """
+  registration {
+    id
+    type
+    keyFile { location contents }
+    state
+    expiration
+    updateExpiration
+  }
+"""
+
+# Based on actual schema: settings.unified.values contains the JSON settings
+SETTINGS_SELECTION = """
+  settings {
+    unified {
+      values
     }
+  }
+"""
+
+# Querying a smaller, curated set of fields to avoid Int overflow and NaN issues
+# pending Unraid API schema fixes for the full Vars type.
+VARS_SELECTION = """
+  vars {
+    id
+    version
+    name
+    timeZone
+    comment
+    security
+    workgroup
+    domain
+    domainShort
+    hideDotFiles
+    localMaster
+    enableFruit
+    useNtp
+    # ntpServer1, ntpServer2, ... are strings, should be okay but numerous
+    domainLogin # Boolean
+    sysModel # String
+    # sysArraySlots, sysCacheSlots are Int, were problematic (NaN)
+    sysFlashSlots # Int, might be okay if small and always set
+    useSsl # Boolean
+    port # Int, usually small
+    portssl # Int, usually small
+    localTld # String
+    bindMgt # Boolean
+    useTelnet # Boolean
+    porttelnet # Int, usually small
+    useSsh # Boolean
+    portssh # Int, usually small
+    startPage # String
+    startArray # Boolean
+    # spindownDelay, queueDepth are Int, potentially okay if always set
+    # defaultFormat, defaultFsType are String
+    shutdownTimeout # Int, potentially okay
+    # luksKeyfile is String
+    # pollAttributes, pollAttributesDefault, pollAttributesStatus are Int/String, were problematic (NaN or type)
+    # nrRequests, nrRequestsDefault, nrRequestsStatus were problematic
+    # mdNumStripes, mdNumStripesDefault, mdNumStripesStatus were problematic
+    # mdSyncWindow, mdSyncWindowDefault, mdSyncWindowStatus were problematic
+    # mdSyncThresh, mdSyncThreshDefault, mdSyncThreshStatus were problematic
+    # mdWriteMethod, mdWriteMethodDefault, mdWriteMethodStatus were problematic
+    # shareDisk, shareUser, shareUserInclude, shareUserExclude are String arrays/String
+    shareSmbEnabled # Boolean
+    shareNfsEnabled # Boolean
+    shareAfpEnabled # Boolean
+    # shareInitialOwner, shareInitialGroup are String
+    shareCacheEnabled # Boolean
+    # shareCacheFloor is String (numeric string?)
+    # shareMoverSchedule, shareMoverLogging are String
+    # fuseRemember, fuseRememberDefault, fuseRememberStatus are String/Boolean, were problematic
+    # fuseDirectio, fuseDirectioDefault, fuseDirectioStatus are String/Boolean, were problematic
+    shareAvahiEnabled # Boolean
+    # shareAvahiSmbName, shareAvahiSmbModel, shareAvahiAfpName, shareAvahiAfpModel are String
+    safeMode # Boolean
+    startMode # String
+    configValid # Boolean
+    configError # String
+    joinStatus # String
+    deviceCount # Int, might be okay
+    flashGuid # String
+    flashProduct # String
+    flashVendor # String
+    # regCheck, regFile, regGuid, regTy, regState, regTo, regTm, regTm2, regGen are varied, mostly String/Int
+    # sbName, sbVersion, sbUpdated, sbEvents, sbState, sbClean, sbSynced, sbSyncErrs, sbSynced2, sbSyncExit are varied
+    # mdColor, mdNumDisks, mdNumDisabled, mdNumInvalid, mdNumMissing, mdNumNew, mdNumErased are Int, potentially okay if counts
+    # mdResync, mdResyncCorr, mdResyncPos, mdResyncDb, mdResyncDt, mdResyncAction are varied (Int/Boolean/String)
+    # mdResyncSize was an overflow
+    mdState # String (enum)
+    mdVersion # String
+    # cacheNumDevices, cacheSbNumDisks were problematic (NaN)
+    # fsState, fsProgress, fsCopyPrcnt, fsNumMounted, fsNumUnmountable, fsUnmountableMask are varied
+    shareCount # Int, might be okay
+    shareSmbCount # Int, might be okay
+    shareNfsCount # Int, might be okay
+    shareAfpCount # Int, might be okay
+    shareMoverActive # Boolean
+    csrfToken # String
+  }
+"""
+
+# (divisor, suffix) table for format_kb, indexed by bit_length so unit
+# selection is a single table probe instead of a comparison ladder
+_KB_UNITS = [(1, "KB"), (1024, "MB"), (1024 * 1024, "GB"), (1024 * 1024 * 1024, "TB")]
+
+
+def format_kb(k: Any) -> str:
+    """Format a kilobyte count into a human-readable KB/MB/GB/TB string.
+
+    Args:
+        k: Kilobyte count (values are strings in SDL for PrefixedID containing
+           types like capacity), or None
+
+    Returns:
+        Formatted size string, or "N/A" when the value is missing
     """
-    try:
-        logger.info("Executing get_system_info")
-        response_data = await make_graphql_request(query)
-        raw_info = response_data.get("info", {})
-        if not raw_info:
-            raise ToolError("No system info returned from Unraid API")
-
-        # Process for human-readable output
-        summary: dict[str, Any] = {}
-        if raw_info.get('os'):
-            os_info = raw_info['os']
-            summary['os'] = f"{os_info.get('distro', '')} {os_info.get('release', '')} ({os_info.get('platform', '')}, {os_info.get('arch', '')})"
-            summary['hostname'] = os_info.get('hostname')
-            summary['uptime'] = os_info.get('uptime')
-
-        if raw_info.get('cpu'):
-            cpu_info = raw_info['cpu']
-            summary['cpu'] = f"{cpu_info.get('manufacturer', '')} {cpu_info.get('brand', '')} ({cpu_info.get('cores')} cores, {cpu_info.get('threads')} threads)"
-
-        if raw_info.get('memory') and raw_info['memory'].get('layout'):
-            mem_layout = raw_info['memory']['layout']
-            summary['memory_layout_details'] = []
-            total_bytes = 0
-            for stick in mem_layout:
-                stick_size = stick.get('size')
-                if stick_size and isinstance(stick_size, (int, float)) and stick_size > 0:
-                    total_bytes += int(stick_size)
-                size_str = ""
-                if stick_size and isinstance(stick_size, (int, float)) and stick_size > 0:
-                    size_gb = stick_size / (1024 ** 3)
-                    size_str = f", Size: {size_gb:.0f} GB"
-                summary['memory_layout_details'].append(
-                    f"Bank {stick.get('bank', '?')}: Type {stick.get('type', '?')}, Speed {stick.get('clockSpeed', '?')}MHz{size_str}, Manufacturer: {stick.get('manufacturer','?')}, Part: {stick.get('partNum', '?')}"
-                )
-            if total_bytes > 0:
-                total_gb = total_bytes / (1024 ** 3)
-                summary['memory_total'] = f"{total_gb:.0f} GB"
+    if k is None:
+        return "N/A"
+    k = int(k)
+    idx = max(0, min(3, (k.bit_length() - 1) // 10))
+    div, suffix = _KB_UNITS[idx]
+    return f"{k / div:.2f} {suffix}" if idx else f"{k} KB"
+
+
+# Disk status -> health bucket; one dict probe per disk instead of chaining
+# string comparisons across six if/elif arms. Statuses outside the table
+# count as 'unknown'.
+_STATUS_BUCKET = {
+    "DISK_OK": "healthy",
+    "DISK_DSBL": "failed",
+    "DISK_INVALID": "failed",
+    "DISK_NP": "missing",
+    "DISK_NEW": "new",
+}
+
+# Tiny revalidation probe for the vars snapshot: id and csrfToken change
+# whenever the underlying vars do, so a matching probe means the cached body
+# is still current and the full query can be skipped (ETag-style).
+VARS_PROBE_QUERY = """
+query VarsProbe {
+  vars {
+    id
+    csrfToken
+  }
+}
+"""
+VARS_PROBE_QUERY_HASH = hashlib.sha256(VARS_PROBE_QUERY.encode()).hexdigest()
+
+# Last known vars snapshot and the (id, csrfToken) etag it was fetched under
+_vars_cache: dict[str, Any] = {"etag": None, "body": None}
+
+
+# Keys always surfaced by get_connect_settings regardless of naming
+_EXPLICIT_CONNECT_KEYS = frozenset({"accessType", "forwardType", "port"})
+
+batcher.register_field("info", INFO_SELECTION)
+batcher.register_field("info_full", INFO_FULL_SELECTION)
+batcher.register_field("array", ARRAY_COUNTS_SELECTION)
+batcher.register_field("array_full", ARRAY_FULL_SELECTION)
+batcher.register_field("network", NETWORK_SELECTION)
+batcher.register_field("registration", REGISTRATION_SELECTION)
+batcher.register_field("settings", SETTINGS_SELECTION)
+batcher.register_field("vars", VARS_SELECTION)
+
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def _graphql_tool(
+    label: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Wrap a tool coroutine with the shared error-to-ToolError translation.
+
+    Every system tool used to carry an identical try/except block; one shared
+    wrapper keeps each tool's own bytecode small and the error shape uniform.
+    ToolErrors raised inside pass through untouched. Generic over the wrapped
+    signature so the @mcp.tool wrappers keep the return types FastMCP inspects.
+
+    Args:
+        label: Human-readable description used in the ToolError message
+    """
+    def decorator(fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await fn(*args, **kwargs)
+            except ToolError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in {fn.__name__}: {e}", exc_info=True)
+                raise ToolError(f"Failed to retrieve {label}: {str(e)}") from e
+        return wrapper
+    return decorator
+
+
+# Standalone functions for use by subscription resources. TTLs are sized to
+# how fast each payload actually changes: hardware/version info is near-static,
+# vars shift occasionally, and array counters are left uncached since disk
+# stats move constantly.
+@async_ttl_cache(60.0, name=INFO_CACHE)
+@_graphql_tool("system information")
+async def _get_system_info(detail_level: Literal["summary", "full"] = "summary") -> dict[str, Any]:
+    """Standalone function to get system info - used by subscriptions and tools."""
+    logger.info("Executing get_system_info")
+    response_data = await batcher.fetch({"info_full" if detail_level == "full" else "info"})
+    raw_info = response_data.get("info", {})
+    if not raw_info:
+        raise ToolError("No system info returned from Unraid API")
+
+    # Process for human-readable output, merging literal blocks so the
+    # dict grows in a few batched updates instead of key-by-key
+    summary: dict[str, Any] = {}
+    os_info = raw_info.get('os')
+    if os_info:
+        summary |= {
+            'os': f"{os_info.get('distro', '')} {os_info.get('release', '')} ({os_info.get('platform', '')}, {os_info.get('arch', '')})",
+            'hostname': os_info.get('hostname'),
+            'uptime': os_info.get('uptime'),
+        }
+
+    cpu_info = raw_info.get('cpu')
+    if cpu_info:
+        summary['cpu'] = f"{cpu_info.get('manufacturer', '')} {cpu_info.get('brand', '')} ({cpu_info.get('cores')} cores, {cpu_info.get('threads')} threads)"
+
+    if raw_info.get('memory') and raw_info['memory'].get('layout'):
+        mem_layout = raw_info['memory']['layout']
+        # Single validity check per stick (the old code ran it twice) and a
+        # bound append so the attribute lookup isn't repeated per DIMM
+        details: list[str] = []
+        append = details.append
+        total_bytes = 0
+        for stick in mem_layout:
+            stick_size = stick.get('size')
+            if isinstance(stick_size, (int, float)) and stick_size > 0:
+                total_bytes += int(stick_size)
+                size_str = f", Size: {stick_size / 1073741824:.0f} GB"
             else:
-                summary['memory_total'] = "Unknown"
-        else:
-            summary['memory_summary'] = "Memory information (layout or stats) not available or failed to retrieve."
+                size_str = ""
+            append(
+                f"Bank {stick.get('bank', '?')}: Type {stick.get('type', '?')}, Speed {stick.get('clockSpeed', '?')}MHz{size_str}, Manufacturer: {stick.get('manufacturer','?')}, Part: {stick.get('partNum', '?')}"
+            )
+        summary |= {
+            'memory_layout_details': details,
+            'memory_total': f"{total_bytes / 1073741824:.0f} GB" if total_bytes > 0 else "Unknown",
+        }
+    else:
+        summary['memory_summary'] = "Memory information (layout or stats) not available or failed to retrieve."
 
-        # Include a key for the full details if needed by an LLM for deeper dives
+    # Only ship the raw field dump when the caller opted into it
+    if detail_level == "full":
         return {"summary": summary, "details": raw_info}
-
-    except Exception as e:
-        logger.error(f"Error in get_system_info: {e}", exc_info=True)
-        raise ToolError(f"Failed to retrieve system information: {str(e)}") from e
+    return {"summary": summary}
 
 
-async def _get_array_status() -> dict[str, Any]:
+@_graphql_tool("array status")
+async def _get_array_status(detail_level: Literal["summary", "full"] = "summary") -> dict[str, Any]:
     """Standalone function to get array status - used by subscriptions and tools."""
-    query = """
-    query GetArrayStatus {
-      array {
-        id
-        state
-        capacity {
-          kilobytes { free used total }
-          disks { free used total }
+    logger.info("Executing get_array_status")
+    response_data = await batcher.fetch({"array_full" if detail_level == "full" else "array"})
+    raw_array_info = response_data.get("array", {})
+    if not raw_array_info:
+        raise ToolError("No array information returned from Unraid API")
+
+    summary: dict[str, Any] = {'state': raw_array_info.get('state')}
+
+    if raw_array_info.get('capacity') and raw_array_info['capacity'].get('kilobytes'):
+        kb_cap = raw_array_info['capacity']['kilobytes']
+        summary |= {
+            'capacity_total': format_kb(kb_cap.get('total')),
+            'capacity_used': format_kb(kb_cap.get('used')),
+            'capacity_free': format_kb(kb_cap.get('free')),
         }
-        boot { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
-        parities { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
-        disks { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
-        caches { id idx name device size status rotational temp numReads numWrites numErrors fsSize fsFree fsUsed exportable type warning critical fsType comment format transport color }
-      }
+
+    summary |= {
+        'num_parity_disks': len(raw_array_info.get('parities', [])),
+        'num_data_disks': len(raw_array_info.get('disks', [])),
+        # Note: caches are pools, not individual cache disks
+        'num_cache_pools': len(raw_array_info.get('caches', [])),
     }
-    """
-    try:
-        logger.info("Executing get_array_status")
-        response_data = await make_graphql_request(query)
-        raw_array_info = response_data.get("array", {})
-        if not raw_array_info:
-            raise ToolError("No array information returned from Unraid API")
-
-        summary: dict[str, Any] = {}
-        summary['state'] = raw_array_info.get('state')
-
-        if raw_array_info.get('capacity') and raw_array_info['capacity'].get('kilobytes'):
-            kb_cap = raw_array_info['capacity']['kilobytes']
-            # Helper to format KB into TB/GB/MB
-            def format_kb(k: Any) -> str:
-                if k is None:
-                    return "N/A"
-                k = int(k) # Values are strings in SDL for PrefixedID containing types like capacity
-                if k >= 1024*1024*1024:
-                    return f"{k / (1024*1024*1024):.2f} TB"
-                if k >= 1024*1024:
-                    return f"{k / (1024*1024):.2f} GB"
-                if k >= 1024:
-                    return f"{k / 1024:.2f} MB"
-                return f"{k} KB"
-
-            summary['capacity_total'] = format_kb(kb_cap.get('total'))
-            summary['capacity_used'] = format_kb(kb_cap.get('used'))
-            summary['capacity_free'] = format_kb(kb_cap.get('free'))
-
-        summary['num_parity_disks'] = len(raw_array_info.get('parities', []))
-        summary['num_data_disks'] = len(raw_array_info.get('disks', []))
-        summary['num_cache_pools'] = len(raw_array_info.get('caches', [])) # Note: caches are pools, not individual cache disks
-
-        # Enhanced: Add disk health summary
-        def analyze_disk_health(disks: list[dict[str, Any]], disk_type: str) -> dict[str, int]:
-            """Analyze health status of disk arrays"""
-            if not disks:
-                return {}
-
-            health_counts = {
-                'healthy': 0,
-                'failed': 0,
-                'missing': 0,
-                'new': 0,
-                'warning': 0,
-                'unknown': 0
-            }
-
-            for disk in disks:
-                status = disk.get('status', '').upper()
-                warning = disk.get('warning')
-                critical = disk.get('critical')
-
-                if status == 'DISK_OK':
-                    if warning or critical:
-                        health_counts['warning'] += 1
-                    else:
-                        health_counts['healthy'] += 1
-                elif status in ['DISK_DSBL', 'DISK_INVALID']:
-                    health_counts['failed'] += 1
-                elif status == 'DISK_NP':
-                    health_counts['missing'] += 1
-                elif status == 'DISK_NEW':
-                    health_counts['new'] += 1
-                else:
-                    health_counts['unknown'] += 1
-
-            return health_counts
-
-        # Analyze health for each disk type
-        health_summary = {}
-        if raw_array_info.get('parities'):
-            health_summary['parity_health'] = analyze_disk_health(raw_array_info['parities'], 'parity')
-        if raw_array_info.get('disks'):
-            health_summary['data_health'] = analyze_disk_health(raw_array_info['disks'], 'data')
-        if raw_array_info.get('caches'):
-            health_summary['cache_health'] = analyze_disk_health(raw_array_info['caches'], 'cache')
-
-        # Overall array health assessment
-        total_failed = sum(h.get('failed', 0) for h in health_summary.values())
-        total_missing = sum(h.get('missing', 0) for h in health_summary.values())
-        total_warning = sum(h.get('warning', 0) for h in health_summary.values())
-
-        if total_failed > 0:
-            overall_health = "CRITICAL"
-        elif total_missing > 0:
-            overall_health = "DEGRADED"
-        elif total_warning > 0:
-            overall_health = "WARNING"
-        else:
-            overall_health = "HEALTHY"
-
-        summary['overall_health'] = overall_health
-        summary['health_summary'] = health_summary
 
+    # Enhanced: Add disk health summary
+    def analyze_disk_health(disks: list[dict[str, Any]], disk_type: str) -> dict[str, int]:
+        """Analyze health status of disk arrays"""
+        if not disks:
+            return {}
+
+        health_counts = dict.fromkeys(
+            ('healthy', 'failed', 'missing', 'new', 'warning', 'unknown'), 0
+        )
+
+        for disk in disks:
+            bucket = _STATUS_BUCKET.get(disk.get('status', '').upper(), 'unknown')
+            if bucket == 'healthy' and (disk.get('warning') or disk.get('critical')):
+                bucket = 'warning'
+            health_counts[bucket] += 1
+
+        return health_counts
+
+    # Analyze health for each disk type
+    health_summary = {}
+    if raw_array_info.get('parities'):
+        health_summary['parity_health'] = analyze_disk_health(raw_array_info['parities'], 'parity')
+    if raw_array_info.get('disks'):
+        health_summary['data_health'] = analyze_disk_health(raw_array_info['disks'], 'data')
+    if raw_array_info.get('caches'):
+        health_summary['cache_health'] = analyze_disk_health(raw_array_info['caches'], 'cache')
+
+    # Overall array health assessment, accumulated in one pass over the
+    # per-type summaries instead of three separate reductions
+    total_failed = total_missing = total_warning = 0
+    for h in health_summary.values():
+        total_failed += h.get('failed', 0)
+        total_missing += h.get('missing', 0)
+        total_warning += h.get('warning', 0)
+
+    if total_failed > 0:
+        overall_health = "CRITICAL"
+    elif total_missing > 0:
+        overall_health = "DEGRADED"
+    elif total_warning > 0:
+        overall_health = "WARNING"
+    else:
+        overall_health = "HEALTHY"
+
+    summary |= {'overall_health': overall_health, 'health_summary': health_summary}
+
+    if detail_level == "full":
         return {"summary": summary, "details": raw_array_info}
+    return {"summary": summary}
+
+
+@async_ttl_cache(300.0, name=NETWORK_CACHE)
+@_graphql_tool("network configuration")
+async def _get_network_config() -> dict[str, Any]:
+    """Standalone function to get network config - cached, access URLs rarely change."""
+    logger.info("Executing get_network_config tool")
+    response_data = await batcher.fetch({"network"})
+    network = response_data.get("network", {})
+    return dict(network) if isinstance(network, dict) else {}
+
 
-    except Exception as e:
-        logger.error(f"Error in get_array_status: {e}", exc_info=True)
-        raise ToolError(f"Failed to retrieve array status: {str(e)}") from e
+@async_ttl_cache(300.0, name=REGISTRATION_CACHE)
+@_graphql_tool("registration information")
+async def _get_registration_info() -> dict[str, Any]:
+    """Standalone function to get registration info - cached, licensing is near-static."""
+    logger.info("Executing get_registration_info tool")
+    response_data = await batcher.fetch({"registration"})
+    registration = response_data.get("registration", {})
+    return dict(registration) if isinstance(registration, dict) else {}
+
+
+@async_ttl_cache(30.0, name=VARS_CACHE)
+@_graphql_tool("Unraid variables")
+async def _get_unraid_variables() -> dict[str, Any]:
+    """Standalone function to get Unraid variables - cached between polls.
+
+    Once a snapshot has been fetched, later calls revalidate it with the tiny
+    id/csrfToken probe and only re-run the full query when the etag moved, so
+    the steady-state cost is a ~100-byte round-trip.
+    """
+    logger.info("Executing get_unraid_variables tool with a selective query")
+    cached_body = _vars_cache["body"]
+    if isinstance(cached_body, dict):
+        probe = await make_graphql_request(
+            VARS_PROBE_QUERY, persisted_hash=VARS_PROBE_QUERY_HASH
+        )
+        probe_vars = probe.get("vars") or {}
+        if (probe_vars.get("id"), probe_vars.get("csrfToken")) == _vars_cache["etag"]:
+            return cached_body
+
+    response_data = await batcher.fetch({"vars"})
+    vars_data = response_data.get("vars", {})
+    body = dict(vars_data) if isinstance(vars_data, dict) else {}
+    _vars_cache["etag"] = (body.get("id"), body.get("csrfToken"))
+    _vars_cache["body"] = body
+    return body
 
 
 def register_system_tools(mcp: FastMCP) -> None:
@@ -214,188 +490,100 @@ def register_system_tools(mcp: FastMCP) -> None:
     """
 
     @mcp.tool()
-    async def get_system_info() -> dict[str, Any]:
-        """Retrieves comprehensive information about the Unraid system, OS, CPU, memory, and baseboard."""
-        return await _get_system_info()
+    async def get_system_info(detail_level: Literal["summary", "full"] = "summary") -> dict[str, Any]:
+        """Retrieves comprehensive information about the Unraid system, OS, CPU, memory, and baseboard.
+
+        Args:
+            detail_level: 'summary' (default) for the processed overview, or
+                'full' to also fetch and return the raw hardware details
+        """
+        return await _get_system_info(detail_level)
+
+    @mcp.tool()
+    async def get_array_status(detail_level: Literal["summary", "full"] = "summary") -> dict[str, Any]:
+        """Retrieves the current status of the Unraid storage array, including its state, capacity, and details of all disks.
+
+        Args:
+            detail_level: 'summary' (default) for state, capacity and health
+                counts, or 'full' to also fetch per-disk I/O counters and
+                return the raw disk details
+        """
+        return await _get_array_status(detail_level)
 
     @mcp.tool()
-    async def get_array_status() -> dict[str, Any]:
-        """Retrieves the current status of the Unraid storage array, including its state, capacity, and details of all disks."""
-        return await _get_array_status()
+    async def get_array_health() -> dict[str, Any]:
+        """Retrieves a lightweight health report for the storage array.
+
+        Backed by the counts-only query (state, capacity, and per-disk
+        status/warning/critical), so it stays cheap even on large arrays.
+        """
+        result = await _get_array_status("summary")
+        summary = result.get("summary")
+        return summary if isinstance(summary, dict) else result
 
     @mcp.tool()
     async def get_network_config() -> dict[str, Any]:
         """Retrieves network configuration details, including access URLs."""
-        query = """
-        query GetNetworkConfig {
-          network {
-            id
-            accessUrls { type name ipv4 ipv6 }
-          }
-        }
-        """
-        try:
-            logger.info("Executing get_network_config tool")
-            response_data = await make_graphql_request(query)
-            network = response_data.get("network", {})
-            return dict(network) if isinstance(network, dict) else {}
-        except Exception as e:
-            logger.error(f"Error in get_network_config: {e}", exc_info=True)
-            raise ToolError(f"Failed to retrieve network configuration: {str(e)}") from e
+        return await _get_network_config()
 
     @mcp.tool()
     async def get_registration_info() -> dict[str, Any]:
         """Retrieves Unraid registration details."""
-        query = """
-        query GetRegistrationInfo {
-          registration {
-            id
-            type
-            keyFile { location contents }
-            state
-            expiration
-            updateExpiration
-          }
-        }
-        """
-        try:
-            logger.info("Executing get_registration_info tool")
-            response_data = await make_graphql_request(query)
-            registration = response_data.get("registration", {})
-            return dict(registration) if isinstance(registration, dict) else {}
-        except Exception as e:
-            logger.error(f"Error in get_registration_info: {e}", exc_info=True)
-            raise ToolError(f"Failed to retrieve registration information: {str(e)}") from e
+        return await _get_registration_info()
 
     @mcp.tool()
+    @_graphql_tool("Unraid Connect settings")
     async def get_connect_settings() -> dict[str, Any]:
         """Retrieves settings related to Unraid Connect."""
-        # Based on actual schema: settings.unified.values contains the JSON settings
-        query = """
-        query GetConnectSettingsForm {
-          settings {
-            unified {
-              values
-            }
-          }
-        }
-        """
-        try:
-            logger.info("Executing get_connect_settings tool")
-            response_data = await make_graphql_request(query)
-
-            # Navigate down to the unified settings values
-            if response_data.get("settings") and response_data["settings"].get("unified"):
-                values = response_data["settings"]["unified"].get("values", {})
-                # Filter for Connect-related settings if values is a dict
-                if isinstance(values, dict):
-                    # Look for connect-related keys in the unified settings
-                    connect_settings = {}
-                    for key, value in values.items():
-                        if 'connect' in key.lower() or key in ['accessType', 'forwardType', 'port']:
-                            connect_settings[key] = value
-                    return connect_settings if connect_settings else values
-                return dict(values) if isinstance(values, dict) else {}
-            return {}
-        except Exception as e:
-            logger.error(f"Error in get_connect_settings: {e}", exc_info=True)
-            raise ToolError(f"Failed to retrieve Unraid Connect settings: {str(e)}") from e
+        logger.info("Executing get_connect_settings tool")
+        response_data = await batcher.fetch({"settings"})
+
+        # Navigate down to the unified settings values
+        if response_data.get("settings") and response_data["settings"].get("unified"):
+            values = response_data["settings"]["unified"].get("values", {})
+            # Filter for Connect-related settings if values is a dict
+            if isinstance(values, dict):
+                # Look for connect-related keys in the unified settings.
+                # Two substring checks on the original key beat a
+                # .lower() call, which allocates a new string per key.
+                connect_settings = {
+                    key: value for key, value in values.items()
+                    if key in _EXPLICIT_CONNECT_KEYS or 'connect' in key or 'Connect' in key
+                }
+                return connect_settings if connect_settings else values
+            return dict(values) if isinstance(values, dict) else {}
+        return {}
 
     @mcp.tool()
     async def get_unraid_variables() -> dict[str, Any]:
         """Retrieves a selection of Unraid system variables and settings.
            Note: Many variables are omitted due to API type issues (Int overflow/NaN).
         """
-        # Querying a smaller, curated set of fields to avoid Int overflow and NaN issues
-        # pending Unraid API schema fixes for the full Vars type.
-        query = """
-        query GetSelectiveUnraidVariables {
-          vars {
-            id
-            version
-            name
-            timeZone
-            comment
-            security
-            workgroup
-            domain
-            domainShort
-            hideDotFiles
-            localMaster
-            enableFruit
-            useNtp
-            # ntpServer1, ntpServer2, ... are strings, should be okay but numerous
-            domainLogin # Boolean
-            sysModel # String
-            # sysArraySlots, sysCacheSlots are Int, were problematic (NaN)
-            sysFlashSlots # Int, might be okay if small and always set
-            useSsl # Boolean
-            port # Int, usually small
-            portssl # Int, usually small
-            localTld # String
-            bindMgt # Boolean
-            useTelnet # Boolean
-            porttelnet # Int, usually small
-            useSsh # Boolean
-            portssh # Int, usually small
-            startPage # String
-            startArray # Boolean
-            # spindownDelay, queueDepth are Int, potentially okay if always set
-            # defaultFormat, defaultFsType are String
-            shutdownTimeout # Int, potentially okay
-            # luksKeyfile is String
-            # pollAttributes, pollAttributesDefault, pollAttributesStatus are Int/String, were problematic (NaN or type)
-            # nrRequests, nrRequestsDefault, nrRequestsStatus were problematic
-            # mdNumStripes, mdNumStripesDefault, mdNumStripesStatus were problematic
-            # mdSyncWindow, mdSyncWindowDefault, mdSyncWindowStatus were problematic
-            # mdSyncThresh, mdSyncThreshDefault, mdSyncThreshStatus were problematic
-            # mdWriteMethod, mdWriteMethodDefault, mdWriteMethodStatus were problematic
-            # shareDisk, shareUser, shareUserInclude, shareUserExclude are String arrays/String
-            shareSmbEnabled # Boolean
-            shareNfsEnabled # Boolean
-            shareAfpEnabled # Boolean
-            # shareInitialOwner, shareInitialGroup are String
-            shareCacheEnabled # Boolean
-            # shareCacheFloor is String (numeric string?)
-            # shareMoverSchedule, shareMoverLogging are String
-            # fuseRemember, fuseRememberDefault, fuseRememberStatus are String/Boolean, were problematic
-            # fuseDirectio, fuseDirectioDefault, fuseDirectioStatus are String/Boolean, were problematic
-            shareAvahiEnabled # Boolean
-            # shareAvahiSmbName, shareAvahiSmbModel, shareAvahiAfpName, shareAvahiAfpModel are String
-            safeMode # Boolean
-            startMode # String
-            configValid # Boolean
-            configError # String
-            joinStatus # String
-            deviceCount # Int, might be okay
-            flashGuid # String
-            flashProduct # String
-            flashVendor # String
-            # regCheck, regFile, regGuid, regTy, regState, regTo, regTm, regTm2, regGen are varied, mostly String/Int
-            # sbName, sbVersion, sbUpdated, sbEvents, sbState, sbClean, sbSynced, sbSyncErrs, sbSynced2, sbSyncExit are varied
-            # mdColor, mdNumDisks, mdNumDisabled, mdNumInvalid, mdNumMissing, mdNumNew, mdNumErased are Int, potentially okay if counts
-            # mdResync, mdResyncCorr, mdResyncPos, mdResyncDb, mdResyncDt, mdResyncAction are varied (Int/Boolean/String)
-            # mdResyncSize was an overflow
-            mdState # String (enum)
-            mdVersion # String
-            # cacheNumDevices, cacheSbNumDisks were problematic (NaN)
-            # fsState, fsProgress, fsCopyPrcnt, fsNumMounted, fsNumUnmountable, fsUnmountableMask are varied
-            shareCount # Int, might be okay
-            shareSmbCount # Int, might be okay
-            shareNfsCount # Int, might be okay
-            shareAfpCount # Int, might be okay
-            shareMoverActive # Boolean
-            csrfToken # String
-          }
-        }
+        return await _get_unraid_variables()
+
+    @mcp.tool()
+    async def get_dashboard_snapshot() -> dict[str, Any]:
+        """Retrieves system info, array status, network config, and registration in one call.
+
+        The four sub-queries run concurrently (and coalesce into a single
+        combined request via the query batcher), so the snapshot costs one
+        round-trip instead of four sequential tool calls.
         """
-        try:
-            logger.info("Executing get_unraid_variables tool with a selective query")
-            response_data = await make_graphql_request(query)
-            vars_data = response_data.get("vars", {})
-            return dict(vars_data) if isinstance(vars_data, dict) else {}
-        except Exception as e:
-            logger.error(f"Error in get_unraid_variables: {e}", exc_info=True)
-            raise ToolError(f"Failed to retrieve Unraid variables: {str(e)}") from e
+        logger.info("Executing get_dashboard_snapshot tool")
+        results = await asyncio.gather(
+            _get_system_info(),
+            _get_array_status(),
+            _get_network_config(),
+            _get_registration_info(),
+            return_exceptions=True,
+        )
+        # Wrap failures per-slot so one failed sub-query doesn't void the snapshot
+        snapshot: dict[str, Any] = {}
+        for slot, result in zip(("system", "array", "network", "registration"), results, strict=True):
+            if isinstance(result, Exception):
+                snapshot[slot] = {"error": str(result)}
+            else:
+                snapshot[slot] = result
+        return snapshot
 
     logger.info("System tools registered successfully")